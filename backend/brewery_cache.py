@@ -4,42 +4,117 @@ Provides caching layer for brewery search results to reduce Google API calls
 """
 
 import hashlib
-import json
 import logging
+import threading
+import zlib
+from functools import lru_cache
+
+import orjson
+from cachetools import TTLCache
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.pool import StaticPool
 
 from models import BrewerySearchCache, CachedBrewery
 from brewery_scraper import Brewery, Beer
 from database import Base
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging configuration is left to the application entry point; configuring
+# it at import time overrides the host app's setup
 logger = logging.getLogger(__name__)
 
+def _encode_payload(data: Any) -> bytes:
+    """Serialize and compress a cache payload (zlib level 1: fast, ~5x smaller)"""
+    return zlib.compress(orjson.dumps(data), 1)
+
+def _decode_payload(raw: Any) -> Any:
+    """Decompress and deserialize a cache payload"""
+    # Rows from the old JSON column come back as str and cannot be
+    # compressed; only bytes payloads need the decompression attempt
+    if isinstance(raw, (bytes, memoryview)):
+        try:
+            raw = zlib.decompress(raw)
+        except zlib.error:
+            pass  # entry written before compression was introduced
+    return orjson.loads(raw)
+
+@lru_cache(maxsize=1024)
+def _cache_key(zipcode: str, radius_miles: int) -> str:
+    """Memoized MD5 cache key for a zipcode + radius combination"""
+    key_string = f"{zipcode}:{radius_miles}"
+    return hashlib.md5(key_string.encode()).hexdigest()
+
 class BreweryCacheService:
     """Service for caching brewery search results and individual brewery data"""
     
-    def __init__(self, database_url: str = "sqlite:///craftbot.db", cache_ttl_hours: int = 24):
+    def __init__(self, database_url: str = "sqlite:///craftbot.db", cache_ttl_hours: int = 24,
+                 cleanup_interval_hours: float = 1):
         """
         Initialize the cache service
-        
+
         Args:
             database_url: SQLAlchemy database URL
             cache_ttl_hours: Time-to-live for cache entries in hours
+            cleanup_interval_hours: How often expired entries are swept in the
+                background (0 disables the background sweep)
         """
-        self.engine = create_engine(database_url)
+        # Share a single pooled connection instead of paying SQLite open/lock
+        # overhead on every cache call
+        self.engine = create_engine(
+            database_url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            # Keep compiled forms of the hot insert/select statements cached
+            query_cache_size=500,
+        )
+        self._configure_sqlite()
         Base.metadata.create_all(self.engine)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         self.cache_ttl_hours = cache_ttl_hours
-        self.in_memory_cache = {}  # Quick in-memory cache for frequently accessed data
-        
+        # Two-tier in-memory cache, both bounded LRU with TTL so long-running
+        # processes can't grow them without limit: a small hot tier holding
+        # parsed Brewery lists and a larger cold tier holding the compact
+        # serialized bytes
+        self.in_memory_cache = TTLCache(maxsize=256, ttl=cache_ttl_hours * 3600)
+        self.serialized_cache = TTLCache(maxsize=1024, ttl=cache_ttl_hours * 3600)
+        # TTLCache is not thread-safe; FastAPI worker threads and the cleanup
+        # timer all touch the tiers, so serialize access behind one lock
+        self._mem_lock = threading.RLock()
+        # Single-flight guard: concurrent writers for the same key coalesce
+        # into one database write
+        self._in_flight_lock = threading.Lock()
+        self._in_flight_writes = set()
+        self._cleanup_timer = None
+        if cleanup_interval_hours > 0:
+            self._schedule_cleanup(cleanup_interval_hours * 3600)
+
+    def _schedule_cleanup(self, interval_seconds: float) -> None:
+        """Run cleanup_expired_cache periodically on a daemon timer thread"""
+        def _run():
+            try:
+                self.cleanup_expired_cache()
+            finally:
+                self._schedule_cleanup(interval_seconds)
+
+        self._cleanup_timer = threading.Timer(interval_seconds, _run)
+        self._cleanup_timer.daemon = True
+        self._cleanup_timer.start()
+
+
+    def _configure_sqlite(self) -> None:
+        """Apply SQLite pragmas so writers don't block readers (WAL) and fsyncs are cheaper"""
+        with self.engine.connect() as conn:
+            conn.execute(text("PRAGMA journal_mode=WAL"))
+            conn.execute(text("PRAGMA synchronous=NORMAL"))
+            conn.execute(text("PRAGMA temp_store=MEMORY"))
+            conn.execute(text("PRAGMA mmap_size=268435456"))
+
     def _generate_cache_key(self, zipcode: str, radius_miles: int) -> str:
         """Generate a unique cache key for zipcode + radius combination"""
-        key_string = f"{zipcode}:{radius_miles}"
-        return hashlib.md5(key_string.encode()).hexdigest()
+        return _cache_key(zipcode, radius_miles)
     
     def get_cached_search(self, zipcode: str, radius_miles: int) -> Optional[List[Brewery]]:
         """
@@ -53,42 +128,66 @@ class BreweryCacheService:
             List of cached breweries or None if not found/expired
         """
         cache_key = self._generate_cache_key(zipcode, radius_miles)
-        
+        now = datetime.utcnow()
+
         # Check in-memory cache first
-        if cache_key in self.in_memory_cache:
-            cached_data, expires_at = self.in_memory_cache[cache_key]
-            if datetime.utcnow() < expires_at:
-                logger.info(f"Cache HIT (in-memory) for zipcode {zipcode}, radius {radius_miles}")
-                return self._deserialize_breweries(cached_data)
-            else:
-                # Expired, remove from memory cache
-                del self.in_memory_cache[cache_key]
-        
+        with self._mem_lock:
+            if cache_key in self.in_memory_cache:
+                cached_data, expires_at = self.in_memory_cache[cache_key]
+                if now < expires_at:
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"Cache HIT (in-memory) for zipcode {zipcode}, radius {radius_miles}")
+                    # Already-parsed Brewery objects; no deserialization needed
+                    return cached_data
+                else:
+                    # Expired, remove from memory cache
+                    del self.in_memory_cache[cache_key]
+
+            # Check the cold tier: serialized bytes, cheaper than a database read
+            if cache_key in self.serialized_cache:
+                cached_bytes, expires_at = self.serialized_cache[cache_key]
+                if now < expires_at:
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"Cache HIT (in-memory, cold) for zipcode {zipcode}, radius {radius_miles}")
+                    breweries = self._deserialize_breweries(_decode_payload(cached_bytes))
+                    # Promote to the hot tier
+                    self.in_memory_cache[cache_key] = (breweries, expires_at)
+                    return breweries
+                else:
+                    del self.serialized_cache[cache_key]
+
+
         # Check database cache
-        db = self.SessionLocal()
-        try:
-            cached_search = db.query(BrewerySearchCache).filter(
-                BrewerySearchCache.id == cache_key,
-                BrewerySearchCache.expires_at > datetime.utcnow()
-            ).first()
-            
-            if cached_search:
-                logger.info(f"Cache HIT (database) for zipcode {zipcode}, radius {radius_miles}")
-                breweries = self._deserialize_breweries(cached_search.search_results)
+        with self.SessionLocal() as db:
+            try:
+                # Fetch just the two columns we need; no ORM entity hydration
+                cached_search = db.execute(
+                    select(BrewerySearchCache.search_results, BrewerySearchCache.expires_at).where(
+                        BrewerySearchCache.id == cache_key,
+                        BrewerySearchCache.expires_at > now
+                    )
+                ).first()
+
+                if cached_search:
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"Cache HIT (database) for zipcode {zipcode}, radius {radius_miles}")
+                    breweries = self._deserialize_breweries(_decode_payload(cached_search.search_results))
+
+                    # Store the parsed objects in the hot tier and the raw
+                    # bytes in the cold tier so repeat hits skip the database
+                    with self._mem_lock:
+                        self.in_memory_cache[cache_key] = (breweries, cached_search.expires_at)
+                        self.serialized_cache[cache_key] = (cached_search.search_results, cached_search.expires_at)
                 
-                # Store in memory cache for faster access
-                self.in_memory_cache[cache_key] = (cached_search.search_results, cached_search.expires_at)
+                    return breweries
+                else:
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"Cache MISS for zipcode {zipcode}, radius {radius_miles}")
+                    return None
                 
-                return breweries
-            else:
-                logger.info(f"Cache MISS for zipcode {zipcode}, radius {radius_miles}")
+            except Exception as e:
+                logger.error(f"Error retrieving cache: {e}")
                 return None
-                
-        except Exception as e:
-            logger.error(f"Error retrieving cache: {e}")
-            return None
-        finally:
-            db.close()
     
     def cache_search_results(self, zipcode: str, radius_miles: int, breweries: List[Brewery]) -> None:
         """
@@ -100,69 +199,75 @@ class BreweryCacheService:
             breweries: List of breweries to cache
         """
         cache_key = self._generate_cache_key(zipcode, radius_miles)
+
+        # If another caller is already writing this key, its results are as
+        # fresh as ours; skip the duplicate serialization and write
+        with self._in_flight_lock:
+            if cache_key in self._in_flight_writes:
+                logger.info(f"Coalescing duplicate cache write for zipcode {zipcode}, radius {radius_miles}")
+                return
+            self._in_flight_writes.add(cache_key)
+
+        try:
+            self._write_search_results(cache_key, zipcode, radius_miles, breweries)
+        finally:
+            with self._in_flight_lock:
+                self._in_flight_writes.discard(cache_key)
+
+    def _write_search_results(self, cache_key: str, zipcode: str, radius_miles: int,
+                              breweries: List[Brewery]) -> None:
+        """Serialize and persist one search result set"""
         expires_at = datetime.utcnow() + timedelta(hours=self.cache_ttl_hours)
-        serialized_data = self._serialize_breweries(breweries)
-        
-        # Store in database
-        db = self.SessionLocal()
+        serialized_data = _encode_payload(self._serialize_breweries(breweries))
+
+        # Store in database; plain Core execution skips the ORM unit of work
+        # and reuses the cached compiled statement
         try:
-            # Remove existing cache entry if it exists
-            db.query(BrewerySearchCache).filter(BrewerySearchCache.id == cache_key).delete()
-            
-            # Create new cache entry
-            cache_entry = BrewerySearchCache(
-                id=cache_key,
+            values = dict(
                 zipcode=zipcode,
                 radius_miles=radius_miles,
                 search_results=serialized_data,
                 expires_at=expires_at
             )
-            
-            db.add(cache_entry)
-            db.commit()
-            
-            # Store in memory cache
-            self.in_memory_cache[cache_key] = (serialized_data, expires_at)
-            
-            logger.info(f"Cached search results for zipcode {zipcode}, radius {radius_miles} (expires: {expires_at})")
-            
+            stmt = sqlite_insert(BrewerySearchCache).values(id=cache_key, **values)
+            with self.engine.begin() as conn:
+                conn.execute(stmt.on_conflict_do_update(index_elements=["id"], set_=values))
+
+            # Store the parsed objects in the hot tier and the bytes in cold
+            with self._mem_lock:
+                self.in_memory_cache[cache_key] = (breweries, expires_at)
+                self.serialized_cache[cache_key] = (serialized_data, expires_at)
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Cached search results for zipcode {zipcode}, radius {radius_miles} (expires: {expires_at})")
+
         except Exception as e:
             logger.error(f"Error caching search results: {e}")
-            db.rollback()
-        finally:
-            db.close()
     
     def get_cached_brewery(self, place_id: str) -> Optional[Brewery]:
         """Get cached individual brewery data"""
-        db = self.SessionLocal()
-        try:
-            cached_brewery = db.query(CachedBrewery).filter(
-                CachedBrewery.id == place_id
-            ).first()
+        with self.SessionLocal() as db:
+            try:
+                cached_brewery = db.query(CachedBrewery).filter(
+                    CachedBrewery.id == place_id
+                ).first()
             
-            if cached_brewery:
-                # Check if data is still fresh (last updated within cache TTL)
-                if datetime.utcnow() - cached_brewery.last_updated < timedelta(hours=self.cache_ttl_hours):
-                    return self._cached_brewery_to_brewery(cached_brewery)
+                if cached_brewery:
+                    # Check if data is still fresh (last updated within cache TTL)
+                    if datetime.utcnow() - cached_brewery.last_updated < timedelta(hours=self.cache_ttl_hours):
+                        return self._cached_brewery_to_brewery(cached_brewery)
             
-            return None
+                return None
             
-        except Exception as e:
-            logger.error(f"Error retrieving cached brewery: {e}")
-            return None
-        finally:
-            db.close()
+            except Exception as e:
+                logger.error(f"Error retrieving cached brewery: {e}")
+                return None
     
     def cache_brewery(self, brewery: Brewery, place_id: str) -> None:
         """Cache individual brewery data"""
-        db = self.SessionLocal()
+        now = datetime.utcnow()
         try:
-            # Remove existing cached brewery if it exists
-            db.query(CachedBrewery).filter(CachedBrewery.id == place_id).delete()
-            
-            # Create new cached brewery entry
-            cached_brewery = CachedBrewery(
-                id=place_id,
+            values = dict(
                 name=brewery.name,
                 address=brewery.address,
                 phone=brewery.phone,
@@ -171,165 +276,156 @@ class BreweryCacheService:
                 longitude=brewery.longitude,
                 rating=brewery.rating,
                 hours=brewery.hours,
+                last_updated=now,
                 tap_list=self._serialize_beers(brewery.beers) if brewery.beers else None,
-                tap_list_updated=datetime.utcnow() if brewery.beers else None
+                tap_list_updated=now if brewery.beers else None
             )
-            
-            db.add(cached_brewery)
-            db.commit()
-            
+            stmt = sqlite_insert(CachedBrewery).values(id=place_id, **values)
+            with self.engine.begin() as conn:
+                conn.execute(stmt.on_conflict_do_update(index_elements=["id"], set_=values))
+
             logger.info(f"Cached brewery data for {brewery.name}")
-            
+
         except Exception as e:
             logger.error(f"Error caching brewery data: {e}")
-            db.rollback()
-        finally:
-            db.close()
     
     def cleanup_expired_cache(self) -> None:
         """Remove expired cache entries"""
-        db = self.SessionLocal()
-        try:
-            # Remove expired search cache entries
-            expired_searches = db.query(BrewerySearchCache).filter(
-                BrewerySearchCache.expires_at < datetime.utcnow()
-            ).count()
-            
-            db.query(BrewerySearchCache).filter(
-                BrewerySearchCache.expires_at < datetime.utcnow()
-            ).delete()
-            
-            # Remove old brewery cache entries (older than 7 days)
-            old_threshold = datetime.utcnow() - timedelta(days=7)
-            expired_breweries = db.query(CachedBrewery).filter(
-                CachedBrewery.last_updated < old_threshold
-            ).count()
-            
-            db.query(CachedBrewery).filter(
-                CachedBrewery.last_updated < old_threshold
-            ).delete()
-            
-            db.commit()
+        now = datetime.utcnow()
+        with self.SessionLocal() as db:
+            try:
+                # Remove expired search cache entries; delete() reports the
+                # rowcount, so no separate COUNT round-trip is needed
+                expired_searches = db.query(BrewerySearchCache).filter(
+                    BrewerySearchCache.expires_at < now
+                ).delete()
+
+                # Remove old brewery cache entries (older than 7 days)
+                old_threshold = now - timedelta(days=7)
+                expired_breweries = db.query(CachedBrewery).filter(
+                    CachedBrewery.last_updated < old_threshold
+                ).delete()
+
+                db.commit()
             
-            logger.info(f"Cleaned up {expired_searches} expired search cache entries and {expired_breweries} old brewery entries")
+                logger.info(f"Cleaned up {expired_searches} expired search cache entries and {expired_breweries} old brewery entries")
             
-        except Exception as e:
-            logger.error(f"Error during cache cleanup: {e}")
-            db.rollback()
-        finally:
-            db.close()
+            except Exception as e:
+                logger.error(f"Error during cache cleanup: {e}")
+                db.rollback()
     
     def clear_all_cache(self) -> Dict[str, int]:
         """Clear all cache entries (search cache and brewery cache)"""
-        db = self.SessionLocal()
-        try:
-            # Count entries before deletion
-            search_count = db.query(BrewerySearchCache).count()
-            brewery_count = db.query(CachedBrewery).count()
-            
-            # Delete all entries
-            db.query(BrewerySearchCache).delete()
-            db.query(CachedBrewery).delete()
-            
-            db.commit()
-            
-            # Clear in-memory cache as well
-            self.in_memory_cache.clear()
-            
-            logger.info(f"Cleared all cache: {search_count} search entries and {brewery_count} brewery entries")
-            
-            return {
-                "search_entries_cleared": search_count,
-                "brewery_entries_cleared": brewery_count,
-                "in_memory_cache_cleared": True
-            }
-            
-        except Exception as e:
-            logger.error(f"Error clearing all cache: {e}")
-            db.rollback()
-            return {"error": str(e)}
-        finally:
-            db.close()
+        with self.SessionLocal() as db:
+            try:
+                # Count entries before deletion
+                search_count = db.query(BrewerySearchCache).count()
+                brewery_count = db.query(CachedBrewery).count()
+            
+                # Delete all entries
+                db.query(BrewerySearchCache).delete()
+                db.query(CachedBrewery).delete()
+            
+                db.commit()
+            
+                # Clear both in-memory tiers as well
+                with self._mem_lock:
+                    self.in_memory_cache.clear()
+                    self.serialized_cache.clear()
+            
+                logger.info(f"Cleared all cache: {search_count} search entries and {brewery_count} brewery entries")
+            
+                return {
+                    "search_entries_cleared": search_count,
+                    "brewery_entries_cleared": brewery_count,
+                    "in_memory_cache_cleared": True
+                }
+            
+            except Exception as e:
+                logger.error(f"Error clearing all cache: {e}")
+                db.rollback()
+                return {"error": str(e)}
     
     def clear_cache_for_zipcode(self, zipcode: str, radius_miles: int = None) -> Dict[str, int]:
         """Clear cache entries for a specific zip code"""
-        db = self.SessionLocal()
-        try:
-            query = db.query(BrewerySearchCache).filter(BrewerySearchCache.zipcode == zipcode)
-            
-            if radius_miles is not None:
-                query = query.filter(BrewerySearchCache.radius_miles == radius_miles)
-            
-            # Count and delete
-            count = query.count()
-            query.delete()
-            
-            db.commit()
-            
-            # Remove from in-memory cache
-            if radius_miles is not None:
-                cache_key = self._generate_cache_key(zipcode, radius_miles)
-                if cache_key in self.in_memory_cache:
-                    del self.in_memory_cache[cache_key]
-            else:
-                # Remove all entries for this zipcode from memory cache
-                keys_to_remove = []
-                for key, (data, expires_at) in self.in_memory_cache.items():
-                    # This is a simplified approach - in production you might want to store zipcode metadata
-                    pass  # For now, we'll clear in-memory cache completely
-                self.in_memory_cache.clear()
-            
-            logger.info(f"Cleared cache for zipcode {zipcode}: {count} entries")
-            
-            return {
-                "entries_cleared": count,
-                "zipcode": zipcode,
-                "radius_miles": radius_miles
-            }
-            
-        except Exception as e:
-            logger.error(f"Error clearing cache for zipcode {zipcode}: {e}")
-            db.rollback()
-            return {"error": str(e)}
-        finally:
-            db.close()
+        with self.SessionLocal() as db:
+            try:
+                query = db.query(BrewerySearchCache).filter(BrewerySearchCache.zipcode == zipcode)
+            
+                if radius_miles is not None:
+                    query = query.filter(BrewerySearchCache.radius_miles == radius_miles)
+            
+                # Count and delete
+                count = query.count()
+                query.delete()
+            
+                db.commit()
+            
+                # Remove from in-memory cache
+                if radius_miles is not None:
+                    cache_key = self._generate_cache_key(zipcode, radius_miles)
+                    with self._mem_lock:
+                        self.in_memory_cache.pop(cache_key, None)
+                        self.serialized_cache.pop(cache_key, None)
+                else:
+                    # Cache keys don't record the zipcode, so clear both
+                    # in-memory tiers completely
+                    with self._mem_lock:
+                        self.in_memory_cache.clear()
+                        self.serialized_cache.clear()
+            
+                logger.info(f"Cleared cache for zipcode {zipcode}: {count} entries")
+            
+                return {
+                    "entries_cleared": count,
+                    "zipcode": zipcode,
+                    "radius_miles": radius_miles
+                }
+            
+            except Exception as e:
+                logger.error(f"Error clearing cache for zipcode {zipcode}: {e}")
+                db.rollback()
+                return {"error": str(e)}
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        db = self.SessionLocal()
-        try:
-            search_cache_count = db.query(BrewerySearchCache).count()
-            brewery_cache_count = db.query(CachedBrewery).count()
-            
-            # Count valid (non-expired) entries
-            valid_search_cache = db.query(BrewerySearchCache).filter(
-                BrewerySearchCache.expires_at > datetime.utcnow()
-            ).count()
-            
-            recent_brewery_cache = db.query(CachedBrewery).filter(
-                CachedBrewery.last_updated > datetime.utcnow() - timedelta(hours=self.cache_ttl_hours)
-            ).count()
-            
-            return {
-                "total_search_cache_entries": search_cache_count,
-                "valid_search_cache_entries": valid_search_cache,
-                "total_brewery_cache_entries": brewery_cache_count,
-                "recent_brewery_cache_entries": recent_brewery_cache,
-                "in_memory_cache_size": len(self.in_memory_cache),
-                "cache_ttl_hours": self.cache_ttl_hours
-            }
-            
-        except Exception as e:
-            logger.error(f"Error getting cache stats: {e}")
-            return {}
-        finally:
-            db.close()
+        now = datetime.utcnow()
+        with self.SessionLocal() as db:
+            try:
+                # All four counts as scalar subqueries in one round-trip
+                recent_threshold = now - timedelta(hours=self.cache_ttl_hours)
+                (search_cache_count, valid_search_cache,
+                 brewery_cache_count, recent_brewery_cache) = db.execute(
+                    select(
+                        select(func.count()).select_from(BrewerySearchCache).scalar_subquery(),
+                        select(func.count()).select_from(BrewerySearchCache).where(
+                            BrewerySearchCache.expires_at > now
+                        ).scalar_subquery(),
+                        select(func.count()).select_from(CachedBrewery).scalar_subquery(),
+                        select(func.count()).select_from(CachedBrewery).where(
+                            CachedBrewery.last_updated > recent_threshold
+                        ).scalar_subquery(),
+                    )
+                ).one()
+            
+                return {
+                    "total_search_cache_entries": search_cache_count,
+                    "valid_search_cache_entries": valid_search_cache,
+                    "total_brewery_cache_entries": brewery_cache_count,
+                    "recent_brewery_cache_entries": recent_brewery_cache,
+                    "in_memory_cache_size": len(self.in_memory_cache),
+                    "serialized_cache_size": len(self.serialized_cache),
+                    "cache_ttl_hours": self.cache_ttl_hours
+                }
+            
+            except Exception as e:
+                logger.error(f"Error getting cache stats: {e}")
+                return {}
     
     def _serialize_breweries(self, breweries: List[Brewery]) -> List[Dict[str, Any]]:
         """Convert brewery objects to serializable dictionaries"""
-        serialized = []
-        for brewery in breweries:
-            brewery_dict = {
+        return [
+            {
                 "name": brewery.name,
                 "address": brewery.address,
                 "phone": brewery.phone,
@@ -341,40 +437,25 @@ class BreweryCacheService:
                 "distance_miles": brewery.distance_miles,
                 "beers": self._serialize_beers(brewery.beers) if brewery.beers else []
             }
-            serialized.append(brewery_dict)
-        return serialized
+            for brewery in breweries
+        ]
     
     def _deserialize_breweries(self, serialized_data: List[Dict[str, Any]]) -> List[Brewery]:
         """Convert serialized dictionaries back to brewery objects"""
-        breweries = []
-        for data in serialized_data:
-            brewery = Brewery(
-                name=data["name"],
-                address=data["address"],
-                phone=data.get("phone"),
-                website=data.get("website"),
-                latitude=data.get("latitude"),
-                longitude=data.get("longitude"),
-                rating=data.get("rating"),
-                hours=data.get("hours"),
-                distance_miles=data.get("distance_miles")
-            )
-            
-            # Deserialize beers
-            if data.get("beers"):
-                brewery.beers = self._deserialize_beers(data["beers"])
-            
-            breweries.append(brewery)
-        return breweries
+        # The serialized keys mirror the dataclass fields, so the dicts can be
+        # splatted straight into the constructors
+        return [
+            Brewery(**{**data, "beers": self._deserialize_beers(data.get("beers") or [])})
+            for data in serialized_data
+        ]
     
     def _serialize_beers(self, beers: List[Beer]) -> List[Dict[str, Any]]:
         """Convert beer objects to serializable dictionaries"""
         if not beers:
             return []
-        
-        serialized = []
-        for beer in beers:
-            beer_dict = {
+
+        return [
+            {
                 "name": beer.name,
                 "style": beer.style,
                 "abv": beer.abv,
@@ -383,24 +464,12 @@ class BreweryCacheService:
                 "price": beer.price,
                 "availability": beer.availability
             }
-            serialized.append(beer_dict)
-        return serialized
+            for beer in beers
+        ]
     
     def _deserialize_beers(self, serialized_data: List[Dict[str, Any]]) -> List[Beer]:
         """Convert serialized dictionaries back to beer objects"""
-        beers = []
-        for data in serialized_data:
-            beer = Beer(
-                name=data["name"],
-                style=data.get("style"),
-                abv=data.get("abv"),
-                ibu=data.get("ibu"),
-                description=data.get("description"),
-                price=data.get("price"),
-                availability=data.get("availability", "On Tap")
-            )
-            beers.append(beer)
-        return beers
+        return [Beer(**data) for data in serialized_data]
     
     def _cached_brewery_to_brewery(self, cached_brewery: CachedBrewery) -> Brewery:
         """Convert CachedBrewery database model to Brewery object"""
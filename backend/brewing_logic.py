@@ -1,50 +1,133 @@
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
 import random
 from schemas import BrewingGuideResponse, BrewingStep
 from models import BeerStyle
 
-class BrewingLogic:
-    def __init__(self):
-        self.style_guides = {
-            "West Coast IPA": {
-                "mash_temp": 67,
-                "mash_time": 60,
-                "boil_time": 90,
-                "hop_additions": [90, 15, 5, 0],
-                "fermentation_temp": 18,
-                "fermentation_days": 14,
-                "dry_hop_days": 7
-            },
-            "Stout": {
-                "mash_temp": 68,
-                "mash_time": 60,
-                "boil_time": 60,
-                "hop_additions": [60, 15],
-                "fermentation_temp": 20,
-                "fermentation_days": 21,
-                "dry_hop_days": 0
-            },
-            "Pilsner": {
-                "mash_temp": 65,
-                "mash_time": 60,
-                "boil_time": 90,
-                "hop_additions": [90, 30],
-                "fermentation_temp": 12,
-                "fermentation_days": 28,
-                "dry_hop_days": 0
-            },
-            "Wheat Beer": {
-                "mash_temp": 66,
-                "mash_time": 60,
-                "boil_time": 60,
-                "hop_additions": [60],
-                "fermentation_temp": 18,
-                "fermentation_days": 14,
-                "dry_hop_days": 0
-            }
-        }
+# Hop addition labels by position in a style's hop schedule; built once
+# instead of per loop iteration in _generate_boil_steps
+HOP_TYPES = ("Bittering", "Flavor", "Aroma", "Whirlpool")
+
+@dataclass(frozen=True, slots=True)
+class StyleParams:
+    """Per-style brewing parameters used by the step generators"""
+    mash_temp: int
+    mash_time: int
+    boil_time: int
+    hop_additions: Tuple[int, ...]
+    fermentation_temp: int
+    fermentation_days: int
+    dry_hop_days: int
+
+# Built once at import; attribute access on the slotted dataclass beats
+# repeated string-keyed dict lookups in the generators, and instances no
+# longer rebuild the table
+STYLE_GUIDES: Dict[str, StyleParams] = {
+    "West Coast IPA": StyleParams(
+        mash_temp=67, mash_time=60, boil_time=90,
+        hop_additions=(90, 15, 5, 0),
+        fermentation_temp=18, fermentation_days=14, dry_hop_days=7,
+    ),
+    "Stout": StyleParams(
+        mash_temp=68, mash_time=60, boil_time=60,
+        hop_additions=(60, 15),
+        fermentation_temp=20, fermentation_days=21, dry_hop_days=0,
+    ),
+    "Pilsner": StyleParams(
+        mash_temp=65, mash_time=60, boil_time=90,
+        hop_additions=(90, 30),
+        fermentation_temp=12, fermentation_days=28, dry_hop_days=0,
+    ),
+    "Wheat Beer": StyleParams(
+        mash_temp=66, mash_time=60, boil_time=60,
+        hop_additions=(60,),
+        fermentation_temp=18, fermentation_days=14, dry_hop_days=0,
+    ),
+}
+
+# Fixed-step templates as (title, description, duration, temperature, notes,
+# tips). Descriptions are str.format templates over the per-call values dict;
+# duration/temperature entries name a computed value when given as a string.
+# Building steps from these tables keeps one copy of every literal instead of
+# re-allocating descriptions and tip lists on each guide generation.
+ALL_GRAIN_PREP_STEPS = (
+    ("Prepare Brewing Water",
+     "Measure {prep_water:.1f}L of water and adjust pH to 5.2-5.6",
+     15, None, "Use brewing salts if needed for style",
+     ("Check water hardness", "Use pH strips to verify")),
+    ("Mash In",
+     "Add grains to {mash_temp}°C water, stir thoroughly",
+     10, "mash_temp", "Maintain consistent temperature",
+     ("Stir well to avoid dough balls", "Check temperature every 15 minutes")),
+    ("Mash Rest",
+     "Maintain {mash_temp}°C for {mash_time} minutes",
+     "mash_time", "mash_temp", "Monitor temperature, stir occasionally",
+     ("Wrap kettle in blankets if needed", "Add hot water if temp drops")),
+    ("Mash Out",
+     "Raise temperature to 77°C for 10 minutes",
+     10, 77, "This stops enzymatic activity",
+     ("Heat slowly to avoid scorching", "Stir constantly while heating")),
+    ("Sparge",
+     "Rinse grains with {sparge_water:.1f}L of 77°C water",
+     30, 77, "Collect wort in brew kettle",
+     ("Don't sparge too quickly", "Check run-off clarity")),
+)
+
+EXTRACT_PREP_STEPS = (
+    ("Prepare Brewing Water",
+     "Fill kettle with {batch_size:.1f}L of water",
+     10, None, "Use filtered water if possible",
+     ("Check water quality", "Remove chlorine if present")),
+    ("Heat Water",
+     "Bring water to boil",
+     20, None, "Cover kettle to speed up heating",
+     ("Watch for boil-over", "Stir occasionally")),
+)
+
+BOIL_START_STEPS = (
+    ("Start Boil",
+     "Bring wort to rolling boil",
+     5, None, "Watch for hot break",
+     ("Control boil intensity", "Add anti-foam if needed")),
+)
 
+POST_BOIL_STEPS = (
+    ("Cool Wort",
+     "Cool wort to 20°C as quickly as possible",
+     30, 20, "Use immersion chiller or ice bath",
+     ("Sanitize chiller", "Stir wort during cooling")),
+    ("Transfer to Fermenter",
+     "Transfer cooled wort to sanitized fermenter",
+     10, None, "Leave trub behind",
+     ("Sanitize everything", "Aerate wort well")),
+    ("Pitch Yeast",
+     "Add yeast and seal fermenter",
+     5, None, "Maintain proper temperature",
+     ("Rehydrate dry yeast", "Check yeast viability")),
+    ("Primary Fermentation",
+     "Ferment at {fermentation_temp}°C for {fermentation_days} days",
+     "fermentation_minutes", "fermentation_temp", "Monitor airlock activity",
+     ("Check temperature daily", "Don't open fermenter unnecessarily")),
+)
+
+DRY_HOP_STEPS = (
+    ("Dry Hop",
+     "Add dry hops for {dry_hop_days} days",
+     "dry_hop_minutes", None, "Add hops to fermenter",
+     ("Sanitize hop bag", "Don't leave too long")),
+)
+
+PACKAGE_STEPS = (
+    ("Bottle/Keg",
+     "Transfer to bottles or keg with priming sugar",
+     60, None, "Prime with appropriate amount of sugar",
+     ("Sanitize bottles", "Calculate priming sugar correctly")),
+)
+
+HOP_STEP_TIPS = ("Measure hops accurately", "Stir well after addition")
+
+class BrewingLogic:
     def generate_guide(self, style_name: str, batch_size: float, method: str, db: Session) -> BrewingGuideResponse:
         """Generate a complete brewing guide for the specified style and method"""
         
@@ -54,7 +137,7 @@ class BrewingLogic:
             raise ValueError(f"Beer style '{style_name}' not found")
         
         # Get style-specific parameters
-        style_params = self.style_guides.get(style_name, self.style_guides["West Coast IPA"])
+        style_params = STYLE_GUIDES.get(style_name, STYLE_GUIDES["West Coast IPA"])
         
         # Generate steps based on method
         if method.lower() == "all-grain":
@@ -82,203 +165,85 @@ class BrewingLogic:
             estimated_abv=estimated_abv
         )
 
-    def _generate_all_grain_steps(self, style_params: Dict[str, Any], batch_size: float) -> List[BrewingStep]:
+    @staticmethod
+    def _emit_steps(templates: tuple, values: Dict[str, Any],
+                    steps: List[BrewingStep], start_step: int) -> int:
+        """Append a BrewingStep per template, returning the next step number"""
+        step_num = start_step
+        for title, description, duration, temperature, notes, tips in templates:
+            steps.append(BrewingStep(
+                step_number=step_num,
+                title=title,
+                description=description.format_map(values) if '{' in description else description,
+                duration_minutes=values[duration] if isinstance(duration, str) else duration,
+                temperature_celsius=values[temperature] if isinstance(temperature, str) else temperature,
+                notes=notes,
+                troubleshooting_tips=list(tips)
+            ))
+            step_num += 1
+        return step_num
+
+    def _generate_all_grain_steps(self, style_params: StyleParams, batch_size: float) -> List[BrewingStep]:
         """Generate steps for all-grain brewing"""
         steps = []
-        step_num = 1
-        
-        # Water preparation
-        steps.append(BrewingStep(
-            step_number=step_num,
-            title="Prepare Brewing Water",
-            description=f"Measure {batch_size * 1.5:.1f}L of water and adjust pH to 5.2-5.6",
-            duration_minutes=15,
-            notes="Use brewing salts if needed for style",
-            troubleshooting_tips=["Check water hardness", "Use pH strips to verify"]
-        ))
-        step_num += 1
-        
-        # Mash in
-        steps.append(BrewingStep(
-            step_number=step_num,
-            title="Mash In",
-            description=f"Add grains to {style_params['mash_temp']}°C water, stir thoroughly",
-            duration_minutes=10,
-            temperature_celsius=style_params['mash_temp'],
-            notes="Maintain consistent temperature",
-            troubleshooting_tips=["Stir well to avoid dough balls", "Check temperature every 15 minutes"]
-        ))
-        step_num += 1
-        
-        # Mash rest
-        steps.append(BrewingStep(
-            step_number=step_num,
-            title="Mash Rest",
-            description=f"Maintain {style_params['mash_temp']}°C for {style_params['mash_time']} minutes",
-            duration_minutes=style_params['mash_time'],
-            temperature_celsius=style_params['mash_temp'],
-            notes="Monitor temperature, stir occasionally",
-            troubleshooting_tips=["Wrap kettle in blankets if needed", "Add hot water if temp drops"]
-        ))
-        step_num += 1
-        
-        # Mash out
-        steps.append(BrewingStep(
-            step_number=step_num,
-            title="Mash Out",
-            description="Raise temperature to 77°C for 10 minutes",
-            duration_minutes=10,
-            temperature_celsius=77,
-            notes="This stops enzymatic activity",
-            troubleshooting_tips=["Heat slowly to avoid scorching", "Stir constantly while heating"]
-        ))
-        step_num += 1
-        
-        # Sparge
-        steps.append(BrewingStep(
-            step_number=step_num,
-            title="Sparge",
-            description=f"Rinse grains with {batch_size * 0.5:.1f}L of 77°C water",
-            duration_minutes=30,
-            temperature_celsius=77,
-            notes="Collect wort in brew kettle",
-            troubleshooting_tips=["Don't sparge too quickly", "Check run-off clarity"]
-        ))
-        step_num += 1
-        
-        # Boil steps
+        values = {
+            'prep_water': batch_size * 1.5,
+            'sparge_water': batch_size * 0.5,
+            'mash_temp': style_params.mash_temp,
+            'mash_time': style_params.mash_time,
+        }
+
+        # Water preparation through sparge, then the shared boil steps
+        step_num = self._emit_steps(ALL_GRAIN_PREP_STEPS, values, steps, 1)
         steps.extend(self._generate_boil_steps(style_params, step_num))
-        
+
         return steps
 
-    def _generate_extract_steps(self, style_params: Dict[str, Any], batch_size: float) -> List[BrewingStep]:
+    def _generate_extract_steps(self, style_params: StyleParams, batch_size: float) -> List[BrewingStep]:
         """Generate steps for extract brewing"""
         steps = []
-        step_num = 1
-        
-        # Water preparation
-        steps.append(BrewingStep(
-            step_number=step_num,
-            title="Prepare Brewing Water",
-            description=f"Fill kettle with {batch_size:.1f}L of water",
-            duration_minutes=10,
-            notes="Use filtered water if possible",
-            troubleshooting_tips=["Check water quality", "Remove chlorine if present"]
-        ))
-        step_num += 1
-        
-        # Heat water
-        steps.append(BrewingStep(
-            step_number=step_num,
-            title="Heat Water",
-            description="Bring water to boil",
-            duration_minutes=20,
-            notes="Cover kettle to speed up heating",
-            troubleshooting_tips=["Watch for boil-over", "Stir occasionally"]
-        ))
-        step_num += 1
-        
-        # Boil steps
+        values = {'batch_size': batch_size}
+
+        # Water preparation and heating, then the shared boil steps
+        step_num = self._emit_steps(EXTRACT_PREP_STEPS, values, steps, 1)
         steps.extend(self._generate_boil_steps(style_params, step_num))
-        
+
         return steps
 
-    def _generate_boil_steps(self, style_params: Dict[str, Any], start_step: int) -> List[BrewingStep]:
+    def _generate_boil_steps(self, style_params: StyleParams, start_step: int) -> List[BrewingStep]:
         """Generate boil and hop addition steps"""
         steps = []
-        step_num = start_step
-        
-        # Start boil
-        steps.append(BrewingStep(
-            step_number=step_num,
-            title="Start Boil",
-            description="Bring wort to rolling boil",
-            duration_minutes=5,
-            notes="Watch for hot break",
-            troubleshooting_tips=["Control boil intensity", "Add anti-foam if needed"]
-        ))
-        step_num += 1
-        
-        # Hop additions
-        for i, boil_time in enumerate(style_params['hop_additions']):
+        fermentation_days = style_params.fermentation_days
+        dry_hop_days = style_params.dry_hop_days
+        values = {
+            'fermentation_temp': style_params.fermentation_temp,
+            'fermentation_days': fermentation_days,
+            'fermentation_minutes': fermentation_days * 24 * 60,  # Convert days to minutes
+            'dry_hop_days': dry_hop_days,
+            'dry_hop_minutes': dry_hop_days * 24 * 60,
+        }
+
+        step_num = self._emit_steps(BOIL_START_STEPS, values, steps, start_step)
+
+        # Hop additions come from the style's schedule, not the fixed tables
+        for i, boil_time in enumerate(style_params.hop_additions):
             if boil_time > 0:
-                hop_type = ["Bittering", "Flavor", "Aroma", "Whirlpool"][i] if i < 4 else "Additional"
+                hop_type = HOP_TYPES[i] if i < len(HOP_TYPES) else "Additional"
                 steps.append(BrewingStep(
                     step_number=step_num,
                     title=f"Add {hop_type} Hops",
                     description=f"Add hops with {boil_time} minutes remaining",
                     duration_minutes=boil_time,
                     notes=f"{hop_type} hop addition",
-                    troubleshooting_tips=["Measure hops accurately", "Stir well after addition"]
+                    troubleshooting_tips=list(HOP_STEP_TIPS)
                 ))
                 step_num += 1
-        
-        # Cool wort
-        steps.append(BrewingStep(
-            step_number=step_num,
-            title="Cool Wort",
-            description="Cool wort to 20°C as quickly as possible",
-            duration_minutes=30,
-            temperature_celsius=20,
-            notes="Use immersion chiller or ice bath",
-            troubleshooting_tips=["Sanitize chiller", "Stir wort during cooling"]
-        ))
-        step_num += 1
-        
-        # Transfer to fermenter
-        steps.append(BrewingStep(
-            step_number=step_num,
-            title="Transfer to Fermenter",
-            description="Transfer cooled wort to sanitized fermenter",
-            duration_minutes=10,
-            notes="Leave trub behind",
-            troubleshooting_tips=["Sanitize everything", "Aerate wort well"]
-        ))
-        step_num += 1
-        
-        # Pitch yeast
-        steps.append(BrewingStep(
-            step_number=step_num,
-            title="Pitch Yeast",
-            description="Add yeast and seal fermenter",
-            duration_minutes=5,
-            notes="Maintain proper temperature",
-            troubleshooting_tips=["Rehydrate dry yeast", "Check yeast viability"]
-        ))
-        step_num += 1
-        
-        # Fermentation
-        steps.append(BrewingStep(
-            step_number=step_num,
-            title="Primary Fermentation",
-            description=f"Ferment at {style_params['fermentation_temp']}°C for {style_params['fermentation_days']} days",
-            duration_minutes=style_params['fermentation_days'] * 24 * 60,  # Convert days to minutes
-            temperature_celsius=style_params['fermentation_temp'],
-            notes="Monitor airlock activity",
-            troubleshooting_tips=["Check temperature daily", "Don't open fermenter unnecessarily"]
-        ))
-        step_num += 1
-        
-        # Dry hop if applicable
-        if style_params['dry_hop_days'] > 0:
-            steps.append(BrewingStep(
-                step_number=step_num,
-                title="Dry Hop",
-                description=f"Add dry hops for {style_params['dry_hop_days']} days",
-                duration_minutes=style_params['dry_hop_days'] * 24 * 60,
-                notes="Add hops to fermenter",
-                troubleshooting_tips=["Sanitize hop bag", "Don't leave too long"]
-            ))
-            step_num += 1
-        
-        # Bottle/keg
-        steps.append(BrewingStep(
-            step_number=step_num,
-            title="Bottle/Keg",
-            description="Transfer to bottles or keg with priming sugar",
-            duration_minutes=60,
-            notes="Prime with appropriate amount of sugar",
-            troubleshooting_tips=["Sanitize bottles", "Calculate priming sugar correctly"]
-        ))
-        
+
+        # Cool, transfer, pitch and ferment; dry hop only when the style
+        # calls for it; then package
+        step_num = self._emit_steps(POST_BOIL_STEPS, values, steps, step_num)
+        if dry_hop_days > 0:
+            step_num = self._emit_steps(DRY_HOP_STEPS, values, steps, step_num)
+        self._emit_steps(PACKAGE_STEPS, values, steps, step_num)
+
         return steps
@@ -1,7 +1,9 @@
 from fastapi import FastAPI, HTTPException, Depends, Query, Path
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
+from collections import Counter
 import json
 import random
 from datetime import datetime, timedelta
@@ -205,9 +207,10 @@ async def get_recipes(db: Session = Depends(get_db)):
     return [{"id": recipe.id, "name": recipe.name, "style_id": recipe.style_id} for recipe in recipes]
 
 # Brewery Scraper Endpoints
-@app.get("/breweries/search/{zipcode}", tags=["breweries"], 
+@app.get("/breweries/search/{zipcode}", tags=["breweries"],
          summary="Search breweries by zip code",
-         response_description="List of breweries with optional tap lists")
+         response_description="List of breweries with optional tap lists",
+         response_class=ORJSONResponse)
 async def search_breweries_by_zipcode(
     zipcode: str = Path(..., description="US zip code to search around", example="94556"), 
     radius_miles: int = Query(25, description="Search radius in miles", ge=1, le=100),
@@ -250,41 +253,42 @@ async def analyze_tap_trends(
     """
     try:
         breweries = await brewery_data_service.get_breweries_with_tap_lists(zipcode, radius_miles)
-        
-        # Analyze the tap data
-        all_beers = []
-        style_counts = {}
-        abv_values = []
-        ibu_values = []
-        
+
+        # Analyze the tap data in one pass over all beers
+        total_beers = 0
+        style_counts = Counter()
+        abv_sum, abv_count = 0.0, 0
+        ibu_sum, ibu_count = 0.0, 0
+
         for brewery in breweries:
-            all_beers.extend(brewery.beers)
-        
-        for beer in all_beers:
-            # Count beer styles
-            if beer.style:
-                style_counts[beer.style] = style_counts.get(beer.style, 0) + 1
-            
-            # Collect ABV values
-            if beer.abv:
-                abv_values.append(beer.abv)
-            
-            # Collect IBU values
-            if beer.ibu:
-                ibu_values.append(beer.ibu)
-        
+            total_beers += len(brewery.beers)
+            for beer in brewery.beers:
+                # Count beer styles
+                if beer.style:
+                    style_counts[beer.style] += 1
+
+                # Accumulate ABV values
+                if beer.abv:
+                    abv_sum += beer.abv
+                    abv_count += 1
+
+                # Accumulate IBU values
+                if beer.ibu:
+                    ibu_sum += beer.ibu
+                    ibu_count += 1
+
         # Calculate statistics
-        avg_abv = sum(abv_values) / len(abv_values) if abv_values else None
-        avg_ibu = sum(ibu_values) / len(ibu_values) if ibu_values else None
-        
+        avg_abv = abv_sum / abv_count if abv_count else None
+        avg_ibu = ibu_sum / ibu_count if ibu_count else None
+
         # Top styles
-        top_styles = sorted(style_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_styles = style_counts.most_common(10)
         
         return {
             "area": f"{zipcode} ({radius_miles} mile radius)",
             "summary": {
                 "total_breweries": len(breweries),
-                "total_beers": len(all_beers),
+                "total_beers": total_beers,
                 "unique_styles": len(style_counts),
                 "average_abv": round(avg_abv, 1) if avg_abv else None,
                 "average_ibu": round(avg_ibu, 1) if avg_ibu else None
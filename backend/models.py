@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, Integer, Text, ForeignKey, JSON, DateTime
+from sqlalchemy import Column, String, Float, Integer, Text, ForeignKey, JSON, DateTime, LargeBinary, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
@@ -59,10 +59,14 @@ class BrewerySearchCache(Base):
     id = Column(String, primary_key=True)  # Generated key based on zipcode + radius
     zipcode = Column(String, index=True)
     radius_miles = Column(Integer)
-    search_results = Column(JSON)  # Cached brewery data
+    search_results = Column(LargeBinary)  # Cached brewery data (orjson-encoded bytes)
     created_at = Column(DateTime, default=datetime.utcnow)
-    expires_at = Column(DateTime)  # When this cache entry expires
-    
+    expires_at = Column(DateTime, index=True)  # When this cache entry expires
+
+    # Covers the "fresh entry by key" lookup without touching the table
+    __table_args__ = (Index("ix_brewery_search_cache_id_expires", "id", "expires_at"),)
+
+
 class CachedBrewery(Base):
     __tablename__ = "cached_breweries"
     
@@ -75,6 +79,6 @@ class CachedBrewery(Base):
     longitude = Column(Float)
     rating = Column(Float)
     hours = Column(Text)
-    last_updated = Column(DateTime, default=datetime.utcnow)
+    last_updated = Column(DateTime, default=datetime.utcnow, index=True)
     tap_list = Column(JSON)  # Cached beer list
     tap_list_updated = Column(DateTime)  # When tap list was last scraped